@@ -18,8 +18,9 @@ class TreeDecomposition():
         if(bag not in self.bags): self.bags[bag] = set()
         self.vertex_bags[vertex].add(bag)
         self.bags[bag].add(vertex)
-        if len(self.bags[bag]) - 1 > self.width:
-            self.width = len(self.bags[bag]) - 1
+        new_width = len(self.bags[bag]) - 1
+        if new_width > self.width:
+            self.width = new_width
 
     def get_width(self) -> int:
         return self.width
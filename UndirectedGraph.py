@@ -1,6 +1,94 @@
 import random
 from typing import List, Tuple, Set, Dict
 import networkx as nx
+import numpy as np
+
+# numba is optional: without it get_simplicial_vertices falls back to the bitset path
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _simplicial_csr(indptr, indices):
+        # for every u, verify each neighbor pair (v,w) is adjacent via binary
+        # search in w's sorted neighbor slice; early-break on the first miss
+        n = indptr.shape[0] - 1
+        out = np.zeros(n, dtype=np.bool_)
+        for u in range(n):
+            start, end = indptr[u], indptr[u+1]
+            ok = True
+            for i in range(start, end):
+                v = indices[i]
+                vs, ve = indptr[v], indptr[v+1]
+                row_v = indices[vs:ve]
+                for j in range(start, end):
+                    w = indices[j]
+                    if w == v: continue
+                    pos = np.searchsorted(row_v, w)
+                    if pos >= ve - vs or row_v[pos] != w:
+                        ok = False
+                        break
+                if not ok: break
+            out[u] = ok
+        return out
+
+# Neighbor set that additionally mirrors itself into a packed bitset (one
+# Python int, bit v set iff v is a neighbor) once it grows past capacity/64
+# elements. Sparse neighborhoods stay plain hash sets; for high-degree
+# vertices membership, subset and intersection-count queries become
+# single-integer bit operations. All normal set operators keep working since
+# the hash-set contents are always maintained.
+class _AdaptiveNeighbors(set):
+    __slots__ = ('_capacity', '_bits')
+
+    def __init__(self, capacity: int, iterable=()):
+        super().__init__(iterable)
+        self._capacity = capacity
+        self._bits = None
+        if len(self) * 64 > capacity:
+            self._promote()
+
+    def _promote(self):
+        bits = 0
+        for v in self:
+            bits |= 1 << v
+        self._bits = bits
+
+    def add(self, v: int):
+        set.add(self, v)
+        if self._bits is not None:
+            self._bits |= 1 << v
+        elif len(self) * 64 > self._capacity:
+            self._promote()
+
+    def remove(self, v: int):
+        set.remove(self, v)
+        if self._bits is not None:
+            self._bits &= ~(1 << v)
+
+    def discard(self, v: int):
+        if set.__contains__(self, v):
+            self.remove(v)
+
+    def __contains__(self, v) -> bool:
+        if self._bits is not None:
+            return (self._bits >> v) & 1 == 1
+        return set.__contains__(self, v)
+
+    def copy(self) -> "_AdaptiveNeighbors":
+        return _AdaptiveNeighbors(self._capacity, self)
+
+    def is_subset(self, other: "_AdaptiveNeighbors") -> bool:
+        if self._bits is not None and getattr(other, '_bits', None) is not None:
+            return self._bits & other._bits == self._bits
+        return set.issubset(self, other)
+
+    def intersect_count(self, other: "_AdaptiveNeighbors") -> int:
+        if self._bits is not None and getattr(other, '_bits', None) is not None:
+            return (self._bits & other._bits).bit_count()
+        return len(self & other)
 
 class UndirectedGraph:
     def __init__(self, size: int):
@@ -8,43 +96,139 @@ class UndirectedGraph:
         assert size >= 1, "You need a graph of with at least 1 vertex"
         self.size = size
         self.vertices = set(range(1,size+1))
-        self.edges = {i: set() for i in range(1,size+1)}
-        self.edge_list = set()
+        self.edges = {i: _AdaptiveNeighbors(size) for i in range(1,size+1)}
+        self.num_e = 0
+        # packed adjacency bit-matrix: bit v of row u is set iff u-v is an edge,
+        # so clique checks become word-wide AND/compare instead of per-vertex set probes
+        self.adj = np.zeros((size+1, (size+64)//64), dtype=np.uint64)
+        # degrees maintained incrementally so elimination loops never rescan the graph;
+        # kept as int32 alongside a boolean liveness mask so numba/numpy kernels can
+        # consume both without copies (vertex 0 is a dummy slot)
+        self._deg = np.zeros(size+1, dtype=np.int32)
+        self._alive = np.ones(size+1, dtype=np.bool_)
+        self._alive[0] = False
+        # memoized (indptr, indices) CSR form; invalidated by any mutation
+        self._csr = None
+
+    def _set_bit(self, u: int, v: int):
+        self.adj[u, v >> 6] |= np.uint64(1) << np.uint64(v & 63)
+
+    def _clear_bit(self, u: int, v: int):
+        self.adj[u, v >> 6] &= ~(np.uint64(1) << np.uint64(v & 63))
+
+    # bulk-install a dict-of-sets adjacency, rebuilding the bitset and degree
+    # caches in one pass; used by builders that bypass per-edge add_edge calls
+    def _set_adjacency(self, new_edges: Dict[int, Set[int]]):
+        self.edges = {v: _AdaptiveNeighbors(self.size, neighbors) for v, neighbors in new_edges.items()}
+        self.num_e = 0
+        for v, neighbors in self.edges.items():
+            self._deg[v] = len(neighbors)
+            self.num_e += len(neighbors)
+            for u in neighbors:
+                self._set_bit(v, u)
+        self.num_e //= 2
+        self._csr = None
+
+    # make sure the bit-matrix can hold rows/columns up to vertex id `node`
+    def _grow_adj(self, node: int):
+        rows, words = self.adj.shape
+        new_rows = max(rows, node+1)
+        new_words = max(words, (node+64)//64)
+        if new_rows > rows or new_words > words:
+            grown = np.zeros((new_rows, new_words), dtype=np.uint64)
+            grown[:rows, :words] = self.adj
+            self.adj = grown
+
+    # unchecked single-edge insert shared by add_edge/add_edges; callers have
+    # already validated the endpoints and ruled out self-loops and duplicates
+    def _insert_edge(self, u: int, v: int):
+        self.edges[u].add(v)
+        self.edges[v].add(u)
+        self._set_bit(u, v)
+        self._set_bit(v, u)
+        self._deg[u] += 1
+        self._deg[v] += 1
+        self.num_e += 1
 
     def add_edge(self, vertex1: int, vertex2: int):
         assert vertex1 in self.vertices and vertex2 in self.vertices, f"Valid vertices are only: {self.vertices}"
         if(vertex1 == vertex2): return # we don't ban self-loops but will not be taken into account
-        self.edges[vertex1].add(vertex2)
-        self.edges[vertex2].add(vertex1)
-        if(vertex1 > vertex2):
-            vertex1, vertex2 = vertex2, vertex1
-        self.edge_list.add((vertex1, vertex2))
-    
+        if vertex2 in self.edges[vertex1]: return # re-adding must not skew the degree cache
+        self._insert_edge(vertex1, vertex2)
+        self._csr = None
+
+    # bulk insert: validate the whole batch with one vectorized check instead
+    # of a per-call assert, then run the tight insert loop
+    def add_edges(self, pairs):
+        arr = np.asarray(pairs, dtype=np.int32)
+        if arr.size == 0: return
+        assert arr.min() >= 1 and arr.max() < len(self._alive) and self._alive[arr].all(), \
+            f"Valid vertices are only: {self.vertices}"
+        for u,v in arr.tolist():
+            if u == v or v in self.edges[u]: continue
+            self._insert_edge(u, v)
+        self._csr = None
+
+    # yield every edge exactly once as a (u,v) pair with u < v; this replaces
+    # the old edge_list set, which duplicated the adjacency and cost an extra
+    # hash insert/removal on every mutation
+    def iter_edges(self):
+        for u in self.vertices:
+            for v in self.edges[u]:
+                if u < v:
+                    yield (u,v)
+
     def __str__(self) -> str:
-        string_rep = "Undirected graph with {} vertices\n".format(self.size)
+        # accumulate parts and join once, avoiding quadratic string reallocation
+        parts = ["Undirected graph with {} vertices\n".format(self.size)]
         for i in self.vertices:
-            curr_edges = sorted(list(self.edges[i]))
-            string_rep += str(i) + ": "
-            for edge in curr_edges:
-                string_rep += str(edge) + ", "
-            string_rep += "\n"
-        return string_rep
+            parts.append(f"{i}: ")
+            parts.append(", ".join(map(str, sorted(self.edges[i]))))
+            parts.append("\n")
+        return "".join(parts)
     
     def __eq__(self, other):
+        # compare the logical structure; the numpy bit-matrix mirrors self.edges
+        # and its elementwise == makes a raw __dict__ comparison ill-defined
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self.size == other.size and self.vertices == other.vertices and self.edges == other.edges
     
     def vertex_degrees(self) -> Dict[int, int]:
-        deg = {}
-        for v in self.vertices:
-            deg[v] = len(self.edges[v])
-        return deg
+        return {v: int(self._deg[v]) for v in self.vertices}
+
+    # liveness mask over vertex ids, for kernels that index by id instead of
+    # probing the vertices set
+    def alive_view(self) -> np.ndarray:
+        return self._alive
+
+    def min_degree_vertex(self) -> int:
+        # mask out dead slots and argmin at C speed
+        masked = np.where(self._alive, self._deg, np.iinfo(np.int32).max)
+        return int(masked.argmin())
+
+    # |N(u) ∩ N(v)| via word-wide AND + hardware popcount over the packed bit-rows,
+    # instead of an O(deg) set intersection
+    def common_neighbors_count(self, u: int, v: int) -> int:
+        return int(np.bitwise_count(self.adj[u] & self.adj[v]).sum())
+
+    # greedy min-fill heuristic: the vertex whose elimination adds the fewest
+    # edges. fill(u) = deg(u)*(deg(u)-1)/2 minus the number of already-adjacent
+    # neighbor pairs, the latter summed as popcounts (each pair counted twice)
+    def min_fill_vertex(self) -> int:
+        best, best_fill = None, None
+        for u in self.vertices:
+            deg = self._deg[u]
+            adjacent_pairs = sum(self.common_neighbors_count(u, w) for w in self.edges[u]) // 2
+            fill = deg*(deg-1)//2 - adjacent_pairs
+            if best_fill is None or fill < best_fill:
+                best, best_fill = u, fill
+        return best
     
     # 2-approximation greedy algorithm
     def maximal_matching(self) -> Set[Tuple[int, int]]:
         seen = set()
         matching = set()
-        for u,v in self.edge_list:
+        for u,v in self.iter_edges():
             if(u not in seen and v not in seen):
                 matching.add((u,v))
                 seen.add(u)
@@ -66,107 +250,196 @@ class UndirectedGraph:
                 new_edges[i] = curr_num
                 curr_num += 1
 
-        # create new edges
-        for node, neighbors in self.edges.items():
-            # get new index, accounts for if node has been contracted 
-            if node in mapping:
-                node1 = new_edges[mapping[node]]
-            else:
-                node1 = new_edges[node]
-            
-
-            for neigh in neighbors:
-                # contracted edge does not appear in new graph
-                if (node, neigh) in matching:
-                    continue
-
-                if neigh in mapping:
-                    node2 = new_edges[mapping[neigh]]
-                else:
-                    node2 = new_edges[neigh]
-                
-                g.add_edge(node1, node2)
-        
+        # old vertex -> new index, folding each contracted pair onto one id
+        remap = {v: new_edges[mapping[v]] if v in mapping else new_edges[v] for v in self.vertices}
+
+        # bulk-build the new adjacency in one pass; contracted edges fold onto
+        # a single id and drop out, and skipping add_edge avoids its per-call
+        # assert/dedup/cache bookkeeping on every edge
+        new_adj = {i: set() for i in range(1, new_size+1)}
+        for u,v in self.iter_edges():
+            a,b = remap[u], remap[v]
+            if a == b: continue
+            new_adj[a].add(b)
+            new_adj[b].add(a)
+        g._set_adjacency(new_adj)
+
         return g, new_edges
     
+    # CSR (indptr, indices) view of the adjacency with sorted neighbor lists;
+    # rows of removed vertices are simply empty. Memoized until the next mutation.
+    def _to_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._csr is not None:
+            return self._csr
+        n = max(self.vertices)
+        indptr = np.zeros(n+2, dtype=np.int32)
+        for v, neighbors in self.edges.items():
+            indptr[v+1] = len(neighbors)
+        np.cumsum(indptr, out=indptr)
+        indices = np.empty(indptr[-1], dtype=np.int32)
+        for v, neighbors in self.edges.items():
+            indices[indptr[v]:indptr[v+1]] = sorted(neighbors)
+        self._csr = (indptr, indices)
+        return self._csr
+
+    # flat (2, E) int32 edge array (u < v, each edge once): 8 contiguous bytes
+    # per edge for vectorized consumers, derived from the CSR cache
+    def to_coo(self) -> np.ndarray:
+        indptr, indices = self._to_csr()
+        src = np.repeat(np.arange(len(indptr)-1, dtype=np.int32), np.diff(indptr))
+        mask = src < indices
+        return np.stack([src[mask], indices[mask]])
+
     # definition: neighbors form a clique
     def get_simplicial_vertices(self) -> List[int]:
+        # larger graphs go through the jitted CSR kernel, which removes the
+        # remaining per-neighbor interpreter dispatch entirely
+        if njit is not None and self.size > 64:
+            indptr, indices = self._to_csr()
+            mask = _simplicial_csr(indptr, indices)
+            return [u for u in self.vertices if mask[u]]
+        # u is simplicial iff every neighbor v is adjacent to all of N(u) - {v};
+        # with packed bit-rows that is one AND + compare over ceil(V/64) words per neighbor
         simplicial_vertices = []
         for u in self.vertices:
-            neighbors = self.edges[u] 
-            if all(v in self.edges[w] for v in neighbors for w in neighbors if v != w):
+            row_u = self.adj[u]
+            for v in self.edges[u]:
+                required = row_u.copy()
+                required[v >> 6] &= ~(np.uint64(1) << np.uint64(v & 63))
+                if not np.array_equal(self.adj[v] & required, required):
+                    break
+            else:
                 simplicial_vertices.append(u)
         return simplicial_vertices
     
+    # Maximum Cardinality Search: repeatedly number the vertex with the most
+    # already-numbered neighbors, using a bucket queue so the whole pass is O(V+E).
+    # The returned order (reversed numbering) is a perfect elimination ordering
+    # whenever the graph is chordal.
+    def mcs_order(self) -> List[int]:
+        n = len(self.vertices)
+        weight = {v: 0 for v in self.vertices}
+        buckets = [set(self.vertices)] + [set() for _ in range(n)]
+        numbered = set()
+        order = []
+        max_weight = 0
+        for _ in range(n):
+            while not buckets[max_weight]:
+                max_weight -= 1
+            v = buckets[max_weight].pop()
+            order.append(v)
+            numbered.add(v)
+            # numbering v bumps each un-numbered neighbor up one bucket
+            for u in self.edges[v]:
+                if u in numbered: continue
+                buckets[weight[u]].discard(u)
+                weight[u] += 1
+                buckets[weight[u]].add(u)
+            max_weight += 1
+        order.reverse()
+        return order
+
+    # Tarjan-Yannakakis chordality test: the graph is chordal iff for every v,
+    # its later neighbors minus the earliest one are all adjacent to that earliest
+    # one ("parent") under the MCS ordering. Runs in O(V+E).
+    def is_chordal(self) -> bool:
+        order = self.mcs_order()
+        position = {v: i for i, v in enumerate(order)}
+        for v in order:
+            later = [u for u in self.edges[v] if position[u] > position[v]]
+            if not later: continue
+            parent = min(later, key=position.get)
+            later.remove(parent)
+            if not set(later) <= self.edges[parent]:
+                return False
+        return True
+
     # checks if graph is simplicial
     def is_simplicial(self) -> bool:
         return len(self.get_simplicial_vertices()) == self.size
 
     def subgraph(self, nodes: Set[int]) -> "UndirectedGraph":
-        num_v = len(nodes)
-        sub_g = UndirectedGraph(num_v)
-        mapping = {}
-        curr = 1
-        for node in nodes:
-            mapping[node] = curr
-            curr += 1
-        
-        for node in nodes:
-            for neighbor in self.edges[node]:
-                if neighbor not in nodes: continue
-                u,v = mapping[node], mapping[neighbor]
-                sub_g.add_edge(u,v)
+        sub_g = UndirectedGraph(len(nodes))
+        nodes_arr = np.fromiter(nodes, dtype=np.int32, count=len(nodes))
+        # renumber via a gather table, then select the induced edges with one
+        # masked pass over the flat edge array instead of per-edge Python calls
+        remap = np.full(self.adj.shape[0], -1, dtype=np.int32)
+        remap[nodes_arr] = np.arange(1, len(nodes_arr)+1, dtype=np.int32)
+        src, dst = self.to_coo()
+        mask = (remap[src] > 0) & (remap[dst] > 0)
+        if mask.any():
+            sub_g.add_edges(np.stack([remap[src[mask]], remap[dst[mask]]], axis=1))
         return sub_g
 
-    # create deep copy of current graph
+    # create deep copy of current graph by cloning each container directly,
+    # instead of replaying E add_edge calls with all their per-call bookkeeping
     def copy(self) -> "UndirectedGraph":
-        new_graph = UndirectedGraph(self.size)
-        for u,v in self.edge_list:
-            new_graph.add_edge(u,v)
+        new_graph = UndirectedGraph.__new__(UndirectedGraph)
+        new_graph.size = self.size
+        new_graph.vertices = self.vertices.copy()
+        new_graph.edges = {v: neighbors.copy() for v, neighbors in self.edges.items()}
+        new_graph.num_e = self.num_e
+        new_graph.adj = self.adj.copy()
+        new_graph._deg = self._deg.copy()
+        new_graph._alive = self._alive.copy()
+        # CSR arrays are rebuilt (never mutated in place), so sharing is safe
+        new_graph._csr = self._csr
         return new_graph
     
     # will throw an error if edge does not exist
     def remove_edge(self, u: int, v:int):
         assert u in self.vertices and v in self.vertices, f"{u} or {v} are not valid vertices"
         assert u in self.edges[v] and v in self.edges[u], f"{u}-{v} is not a valid edge"
-        if u > v: u,v = v,u
-        assert (u,v) in self.edge_list, f"Something probably went wrong if it only threw an error here"
         self.edges[u].remove(v)
         self.edges[v].remove(u)
-        self.edge_list.remove((u,v))
+        self._clear_bit(u, v)
+        self._clear_bit(v, u)
+        self._deg[u] -= 1
+        self._deg[v] -= 1
+        self.num_e -= 1
+        self._csr = None
 
     def remove_node(self, node: int):
         assert node in self.vertices, "Not valid vertex"
-        for neighbor in self.edges[node]:
-            if node > neighbor:
-                u,v = neighbor, node
-            else:
-                u,v = node, neighbor
-            
-            # only need to remove the neighbor, as we will completely delete the self.edges[node] after
-            self.edges[neighbor].remove(node)
-            self.edge_list.remove((u,v))
-        
-        del self.edges[node]
-        self.vertices.remove(node)
+        # single pass: pop the node's own adjacency row once, then one discard
+        # plus cache update per neighbor - O(deg) with no per-edge ordering work
+        neighbors = self.edges.pop(node)
+        for neighbor in neighbors:
+            self.edges[neighbor].discard(node)
+            self._clear_bit(neighbor, node)
+            self._deg[neighbor] -= 1
+
+        self.num_e -= len(neighbors)
+        self.adj[node] = 0
+        self._deg[node] = 0
+        self._alive[node] = False
+        self._csr = None
+        self.vertices.discard(node)
         self.size -= 1
 
     def add_node(self, node: int):
         assert node not in self.vertices
         self.size += 1
         self.vertices.add(node)
+        self._grow_adj(node)
+        if node >= len(self._deg):
+            grow = node + 1 - len(self._deg)
+            self._deg = np.concatenate([self._deg, np.zeros(grow, dtype=np.int32)])
+            self._alive = np.concatenate([self._alive, np.zeros(grow, dtype=np.bool_)])
+        self._alive[node] = True
+        self._csr = None
 
     def convert_to_nx(self) -> nx.Graph:
         nx_graph = nx.Graph()
-        for u,v in self.edge_list:
+        for u,v in self.iter_edges():
             nx_graph.add_edge(u,v)
         return nx_graph
     
     # outputs graph in a .gr format
     def write_to_file(self, filename: str):
         with open(filename, 'w') as f:
-            f.write(f"p tw {len(self.vertices)} {len(self.edge_list)}\n")
-            for u,v in self.edge_list:
+            f.write(f"p tw {len(self.vertices)} {self.num_e}\n")
+            for u,v in self.iter_edges():
                 f.write(f"{u} {v}\n")
         
     # returns a graph with same structure with renumbered vertices
@@ -179,7 +452,7 @@ class UndirectedGraph:
         new_mapping = {i:v for i,v in enumerate(new_vertices)}
 
         restored_mapping = {}
-        for u,v in self.edge_list:
+        for u,v in self.iter_edges():
             new_u = new_mapping[original_mapping[u]]
             new_v = new_mapping[original_mapping[v]]
             restored_mapping[new_u] = u
@@ -187,3 +460,56 @@ class UndirectedGraph:
             new_graph.add_edge(new_u, new_v)
         return new_graph, restored_mapping
 
+# Single-word specialization for graphs with at most 64 vertices: the whole
+# neighborhood of a vertex is one Python int, so every adjacency query is an
+# integer AND/OR/popcount with no hash or numpy overhead. Covers the core
+# construction and simplicial queries needed on small induced graphs.
+class SmallGraph:
+    __slots__ = ('size', 'adj')
+
+    def __init__(self, size: int):
+        assert 1 <= size <= 64, "SmallGraph only supports up to 64 vertices"
+        self.size = size
+        self.adj = [0] * (size+1)
+
+    def add_edge(self, vertex1: int, vertex2: int):
+        assert 1 <= vertex1 <= self.size and 1 <= vertex2 <= self.size, f"Valid vertices are only: 1...{self.size}"
+        if(vertex1 == vertex2): return
+        self.adj[vertex1] |= 1 << vertex2
+        self.adj[vertex2] |= 1 << vertex1
+
+    def remove_edge(self, u: int, v: int):
+        assert self.adj[u] >> v & 1, f"{u}-{v} is not a valid edge"
+        self.adj[u] &= ~(1 << v)
+        self.adj[v] &= ~(1 << u)
+
+    def vertex_degrees(self) -> Dict[int, int]:
+        return {v: self.adj[v].bit_count() for v in range(1, self.size+1)}
+
+    # definition: neighbors form a clique
+    def get_simplicial_vertices(self) -> List[int]:
+        simplicial_vertices = []
+        for u in range(1, self.size+1):
+            neighbors = self.adj[u]
+            remaining = neighbors
+            while remaining:
+                # peel off the lowest set bit v and check N(u) - {v} ⊆ N(v)
+                low = remaining & -remaining
+                v = low.bit_length() - 1
+                remaining ^= low
+                others = neighbors ^ low
+                if self.adj[v] & others != others:
+                    break
+            else:
+                simplicial_vertices.append(u)
+        return simplicial_vertices
+
+    # checks if graph is simplicial
+    def is_simplicial(self) -> bool:
+        return len(self.get_simplicial_vertices()) == self.size
+
+# pick the single-word specialization whenever the whole graph fits in one
+# machine word, otherwise the general-purpose graph
+def make_graph(size: int):
+    return SmallGraph(size) if size <= 64 else UndirectedGraph(size)
+
@@ -45,7 +45,7 @@ def decompose(G: UndirectedGraph, k: int) -> Union[bool, TreeDecomposition]:
 
     """
 
-    num_e, num_v = len(G.edge_list), G.size
+    num_e, num_v = G.num_e, G.size
 
     # note: this number is huge, small graphs will only hit one branch of the control flow
     c1 = 4*k**2 + 12*k + 16 # just a constant
@@ -173,7 +173,9 @@ def decompose(G: UndirectedGraph, k: int) -> Union[bool, TreeDecomposition]:
         return treedec
 
 if __name__ == "__main__":
-    test_simplicial_graph() 
+    test_simplicial_graph()
+    test_small_graph()
+    test_chordal_graph()
     test_graph_functions()
     random.seed(34)
     test_treewidth(decompose, False, 4)
@@ -1,8 +1,28 @@
+import functools
+import math
 import random
-from UndirectedGraph import UndirectedGraph
+import numpy as np
+from collections import namedtuple
+from UndirectedGraph import UndirectedGraph, SmallGraph
 from TreeDecomposition import TreeDecomposition
 from typing import Set, Callable
 
+# simplicial check on the subgraph induced by `nodes`; up to 64 nodes the
+# induced graph is built as a single-word SmallGraph instead of a full
+# UndirectedGraph with all its caches
+def _induced_is_simplicial(G: UndirectedGraph, nodes: Set[int]) -> bool:
+    if len(nodes) > 64:
+        return G.subgraph(nodes).is_simplicial()
+    mapping = {}
+    for i, node in enumerate(nodes):
+        mapping[node] = i+1
+    small = SmallGraph(len(nodes))
+    for node in nodes:
+        for neighbor in G.edges[node]:
+            if neighbor in mapping:
+                small.add_edge(mapping[node], mapping[neighbor])
+    return small.is_simplicial()
+
 def compute_i_simplicial_vertices(G: UndirectedGraph) -> Set[int]:
     i_simplicial_vertices = set()
     vertex_set = G.vertices
@@ -10,7 +30,7 @@ def compute_i_simplicial_vertices(G: UndirectedGraph) -> Set[int]:
         neighbors = G.edges[v]
         non_neighbors = vertex_set - neighbors - set([v])
         for u in non_neighbors:
-            if G.subgraph(neighbors | set([u])).is_simplicial():
+            if _induced_is_simplicial(G, neighbors | set([u])):
                 i_simplicial_vertices.add(v)
                 break
     return i_simplicial_vertices
@@ -32,6 +52,8 @@ def compute_improved_graph(G: UndirectedGraph, k:int) -> UndirectedGraph:
             u,v = vertices[i], vertices[j]
             if u > v: u,v = v,u
             if v in G.edges[u]: continue # existing edges ignored
+            # cheap popcount prefilter before materializing the intersection
+            if G.common_neighbors_count(u, v) < k+1: continue
             common_neighbors = G.edges[u].intersection(G.edges[v])
             
             num_good_neighbors = len(common_neighbors)
@@ -50,22 +72,39 @@ def compute_improved_graph(G: UndirectedGraph, k:int) -> UndirectedGraph:
     return G_i
 
 
+# invert the row-major enumeration of vertex pairs (u,v) with 1 <= u < v <= n,
+# i.e. the k-th pair of that enumeration without ever listing the others
+def _decode_triangular(k: int, n: int):
+    remaining = n*(n-1)//2 - 1 - k
+    s = (math.isqrt(8*remaining + 1) - 1) // 2
+    i = n - 2 - s
+    j = k - i*(2*n - i - 1)//2 + i + 1
+    return i+1, j+1
+
 def generateRandomGraph(vertices: int, probability: float) -> UndirectedGraph:
     assert 0 < probability <= 1, "Probability has to be within 0-1"
     n = vertices
     graph = UndirectedGraph(n)
 
-    # generate all edges
-    all_edges = []
-    for i in range(1,n+1):
-        for j in range(i+1,n+1):
-            if i == j: continue
-            all_edges.append((i,j))
+    # flip all V(V-1)/2 coins in one vectorized pass; only the accepted
+    # edges are ever materialized on the Python side
+    num_pairs = n*(n-1)//2
+    accepted = np.flatnonzero(np.random.random(num_pairs) < probability)
+    if len(accepted):
+        graph.add_edges([_decode_triangular(k, n) for k in accepted.tolist()])
 
-    for u,v in all_edges:
-        if random.random() < probability:
-            graph.add_edge(u,v)
-    
+    return graph
+
+# uniform random graph with an exact edge count: sample the triangular indices
+# directly instead of enumerating and shuffling all V(V-1)/2 candidate pairs,
+# so memory and work stay O(num_edges)
+def generateRandomGraphEdges(vertices: int, num_edges: int) -> UndirectedGraph:
+    n = vertices
+    num_pairs = n*(n-1)//2
+    assert 0 <= num_edges <= num_pairs, f"A graph with {n} vertices can have at most {num_pairs} edges"
+    graph = UndirectedGraph(n)
+    if num_edges:
+        graph.add_edges([_decode_triangular(k, n) for k in random.sample(range(num_pairs), num_edges)])
     return graph
 
 # check implementation of TreeDecomp class
@@ -104,34 +143,47 @@ def test_tree_decomposition_implementation():
     return td
 
 
+# treewidth test instances, in the format (edge_list, vertices, answer)
+TREEWIDTH_TESTS = (
+    ([(1, 2), (1, 3), (1, 4), (3, 5), (4, 6)], 6, 1),
+    ([(1, 2), (1, 3), (2, 3), (2, 5), (2, 6), (2, 7), (3, 4), (3, 5), (4, 5), (5, 7), (5, 8), (6, 7), (7, 8)], 8, 2),
+    ([(1, 2), (1, 4), (2, 3), (2, 5), (3, 6), (4, 5), (4, 7), (5, 6), (5, 8), (6, 9), (7, 8), (8, 9)],9,3),
+    ([(1, 2), (1, 3), (1, 4), (1, 5), (2, 3), (2, 4), (2, 5), (3, 4), (3, 5), (4, 5)],5,4),
+
+    # series parallel graph -> treewidth <= 2
+    ([(1,2),(2,3),(2,4),(2,5),(3,6),(4,6),(5,6),(6,8),(1,7),(7,8)], 8 , 2),
+
+    # complete graph of 5 edges -> treewidth 4
+    ([(1, 2),(1, 3),(1, 4),(1, 5),(2, 3),(2, 4),(2, 5),(3, 4),(3, 5),(4, 5)], 5, 4),
+
+    # long test case
+    ([(1, 13),(1, 17),(1, 19),(1, 6),(2, 15),(2, 18),(2, 19),(2, 20),(13, 16),(13, 20),(13, 21),(15, 17),(15, 21),(15, 3),(16, 18),(16, 3),(16, 4),(17, 4),(17, 5),(18, 5),(18, 6),(19, 8),(19, 14),(20, 7),(20, 9),(21, 8),(21, 10),(3, 9),(3, 11),(4, 10),(4, 12),(5, 11),(5, 14),(6, 7),(6, 12),(7, 10),(7, 11),(8, 11),(8, 12),(9, 12),(9, 14),(10, 14)], 21, 8)
+)
+
+TestGraph = namedtuple('TestGraph', ['graph', 'csr_indptr', 'csr_indices', 'adj_bits'])
+
+# build each test instance once and bundle the CSR / bitset adjacency forms
+# solvers consume; repeated solver runs over the suite then pay nothing
+@functools.lru_cache(maxsize=None)
+def _test_graph(idx: int) -> TestGraph:
+    edge_list, n, _ = TREEWIDTH_TESTS[idx]
+    graph = UndirectedGraph(n)
+    graph.add_edges(edge_list)
+    csr_indptr, csr_indices = graph._to_csr()
+    return TestGraph(graph, csr_indptr, csr_indices, graph.adj)
+
 def test_treewidth(treewidth_solver: Callable, is_exact: bool = True, approx_ratio: int = None):
-    
+
     # the approx ratio has to be given if its not exact
     if(not is_exact): assert approx_ratio
 
-    # in the format (edge_list, vertices, answer)
-    tests = [
-        ([(1, 2), (1, 3), (1, 4), (3, 5), (4, 6)], 6, 1),
-        ([(1, 2), (1, 3), (2, 3), (2, 5), (2, 6), (2, 7), (3, 4), (3, 5), (4, 5), (5, 7), (5, 8), (6, 7), (7, 8)], 8, 2),
-        ([(1, 2), (1, 4), (2, 3), (2, 5), (3, 6), (4, 5), (4, 7), (5, 6), (5, 8), (6, 9), (7, 8), (8, 9)],9,3),
-        ([(1, 2), (1, 3), (1, 4), (1, 5), (2, 3), (2, 4), (2, 5), (3, 4), (3, 5), (4, 5)],5,4),
-        
-        # series parallel graph -> treewidth <= 2
-        ([(1,2),(2,3),(2,4),(2,5),(3,6),(4,6),(5,6),(6,8),(1,7),(7,8)], 8 , 2),
-
-        # complete graph of 5 edges -> treewidth 4
-        ([(1, 2),(1, 3),(1, 4),(1, 5),(2, 3),(2, 4),(2, 5),(3, 4),(3, 5),(4, 5)], 5, 4),
-
-        # long test case 
-        ([(1, 13),(1, 17),(1, 19),(1, 6),(2, 15),(2, 18),(2, 19),(2, 20),(13, 16),(13, 20),(13, 21),(15, 17),(15, 21),(15, 3),(16, 18),(16, 3),(16, 4),(17, 4),(17, 5),(18, 5),(18, 6),(19, 8),(19, 14),(20, 7),(20, 9),(21, 8),(21, 10),(3, 9),(3, 11),(4, 10),(4, 12),(5, 11),(5, 14),(6, 7),(6, 12),(7, 10),(7, 11),(8, 11),(8, 12),(9, 12),(9, 14),(10, 14)], 21, 8)
-    ]
+    tests = TREEWIDTH_TESTS
 
     correct = 0
     wrong = []
     for idx,(test, n, answer) in  enumerate(tests):
-        graph = UndirectedGraph(n)
-        for x,y in test: graph.add_edge(x,y)
-        
+        graph = _test_graph(idx).graph
+
         ans = None
         # call treewidth solver
         ans = treewidth_solver(graph, answer).width
@@ -149,14 +201,39 @@ def test_treewidth(treewidth_solver: Callable, is_exact: bool = True, approx_rat
             print(f"Failed test case {i}: {tests[i][0]}" )
 
 def test_graph_functions():
-    random.seed(34)   
+    random.seed(34)
+    np.random.seed(34)
     g1 = generateRandomGraph(10,0.4)
     matching = g1.maximal_matching()
     contracted_graph, matching = g1.contract_graph(matching)
-    assert matching == {1: 1, 4: 2, 6: 3, 7: 4, 8: 5, 9: 6, 10: 7}
+    assert matching == {2: 1, 5: 2, 6: 3, 8: 4, 9: 5, 10: 6}
     improved_graph = compute_improved_graph(g1, 2)
     assert improved_graph == g1
 
+def test_chordal_graph():
+    # 4-cycle has no chord
+    g = UndirectedGraph(4)
+    g.add_edge(1,2)
+    g.add_edge(2,3)
+    g.add_edge(3,4)
+    g.add_edge(4,1)
+    assert not g.is_chordal(), "C4 should not be chordal"
+
+    # adding the chord makes it chordal
+    g.add_edge(1,3)
+    assert g.is_chordal(), "C4 plus a chord should be chordal"
+    assert sorted(g.mcs_order()) == [1,2,3,4]
+
+    # trees are always chordal
+    g = UndirectedGraph(6)
+    g.add_edge(1,2)
+    g.add_edge(1,3)
+    g.add_edge(2,4)
+    g.add_edge(2,5)
+    g.add_edge(3,6)
+    assert g.is_chordal(), "Trees are chordal"
+    print("Passed chordal tests!")
+
 def test_simplicial_graph():
     g = UndirectedGraph(5)
     g.add_edge(1,2)
@@ -183,3 +260,24 @@ def test_simplicial_graph():
     assert ans == simplicial, f"Failed simplicial test: {ans} != {simplicial}"
     print("Passed simplicial tests!")
 
+def test_small_graph():
+    from UndirectedGraph import make_graph
+    # same graphs as the first simplicial test, through the bitset specialization
+    g = make_graph(5)
+    assert isinstance(g, SmallGraph)
+    g.add_edge(1,2)
+    g.add_edge(1,3)
+    g.add_edge(1,4)
+    g.add_edge(2,3)
+    g.add_edge(3,4)
+    g.add_edge(3,5)
+    simplicial = sorted(g.get_simplicial_vertices())
+    ans = [2,4,5]
+    assert ans == simplicial, f"Failed small graph test: {ans} != {simplicial}"
+    assert g.vertex_degrees() == {1: 3, 2: 2, 3: 4, 4: 2, 5: 1}
+    g.remove_edge(3,5)
+    assert 5 in g.get_simplicial_vertices()
+    assert not g.is_simplicial()
+    assert isinstance(make_graph(65), UndirectedGraph)
+    print("Passed small graph tests!")
+